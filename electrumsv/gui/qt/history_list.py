@@ -24,12 +24,13 @@
 # SOFTWARE.
 
 import enum
+from functools import lru_cache
 import time
-from typing import Union
+from typing import Dict, Union
 import webbrowser
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QBrush, QColor, QIcon
+from PyQt5.QtGui import QFont, QBrush, QColor
 from PyQt5.QtWidgets import QMenu
 
 from electrumsv.app_state import app_state
@@ -80,6 +81,8 @@ class HistoryList(MyTreeWidget):
         self.monospace_font = QFont(platform.monospace_font)
         self.withdrawalBrush = QBrush(QColor("#BC1E1E"))
         self.invoiceIcon = read_QIcon("seal")
+        self.txIcons = [ read_QIcon(icon_name) for icon_name in TX_ICONS ]
+        self._tx_items: Dict[str, SortableTreeWidgetItem] = {}
 
     def refresh_headers(self):
         headers = ['', '', _('Date'), _('Description') , _('Amount'), _('Balance')]
@@ -97,48 +100,69 @@ class HistoryList(MyTreeWidget):
 
     @profiler
     def _on_update_history_list(self):
-        self.wallet = self.parent.wallet
-        h = self.wallet.get_history(self.get_domain())
+        self.wallet = wallet = self.parent.wallet
+        h = wallet.get_history(self.get_domain())
         item = self.currentItem()
         current_tx = item.data(0, Qt.UserRole) if item else None
         self.clear()
+        self._tx_items.clear()
         fx = app_state.fx
         if fx:
             fx.history_used_spot = False
+        show_fiat = fx and fx.show_history()
+        # Unconfirmed transactions are all valued at the current time.
+        now_date = timestamp_to_datetime(time.time())
+        column_count = 8 if show_fiat else 6
+        right_aligned_columns = range(4, column_count)
+        monospace_columns = [ i for i in range(column_count) if i != 2 ]
+        get_label = wallet.get_label
+        get_paid_invoice = wallet.invoices.paid.get
+        format_amount = self.parent.format_amount
+        items = []
         for h_item in h:
             tx_hash, height, conf, timestamp, value, balance = h_item
-            status = get_tx_status(self.wallet, tx_hash, height, conf, timestamp)
+            status = get_tx_status(wallet, tx_hash, height, conf, timestamp)
             status_str = get_tx_desc(status, timestamp)
-            has_invoice = self.wallet.invoices.paid.get(tx_hash)
-            icon = get_tx_icon(status)
-            v_str = self.parent.format_amount(value, True, whitespaces=True)
-            balance_str = self.parent.format_amount(balance, whitespaces=True)
-            label = self.wallet.get_label(tx_hash)
+            has_invoice = get_paid_invoice(tx_hash)
+            icon = self.txIcons[status]
+            v_str = format_amount(value, True, whitespaces=True)
+            balance_str = format_amount(balance, whitespaces=True)
+            label = get_label(tx_hash)
             entry = ['', tx_hash, status_str, label, v_str, balance_str]
-            if fx and fx.show_history():
-                date = timestamp_to_datetime(time.time() if conf <= 0 else timestamp)
+            if show_fiat:
+                date = now_date if conf <= 0 else timestamp_to_datetime(timestamp)
+                # The amount and balance are valued at the same historical rate.
+                rate = fx.history_rate(date)
                 for amount in [value, balance]:
-                    text = fx.historical_value_str(amount, date)
+                    text = fx.value_str(amount, rate)
                     entry.append(text)
 
             item = SortableTreeWidgetItem(entry)
             item.setIcon(0, icon)
             item.setToolTip(0, get_tx_tooltip(status, conf))
             item.setData(0, SortableTreeWidgetItem.DataRole, (status, conf))
+            # Sort amounts on their raw values rather than parsing the display text.
+            if value is not None:
+                item.setData(4, SortableTreeWidgetItem.DataRole, value)
+            if balance is not None:
+                item.setData(5, SortableTreeWidgetItem.DataRole, balance)
             if has_invoice:
                 item.setIcon(3, self.invoiceIcon)
-            for i in range(len(entry)):
-                if i>3:
-                    item.setTextAlignment(i, Qt.AlignRight)
-                if i!=2:
-                    item.setFont(i, self.monospace_font)
+            for i in right_aligned_columns:
+                item.setTextAlignment(i, Qt.AlignRight)
+            for i in monospace_columns:
+                item.setFont(i, self.monospace_font)
             if value and value < 0:
                 item.setForeground(3, self.withdrawalBrush)
                 item.setForeground(4, self.withdrawalBrush)
             item.setData(0, Qt.UserRole, tx_hash)
-            self.insertTopLevelItem(0, item)
-            if current_tx == tx_hash:
-                self.setCurrentItem(item)
+            self._tx_items[tx_hash] = item
+            items.append(item)
+        # The history is oldest first and is displayed newest first.
+        items.reverse()
+        self.addTopLevelItems(items)
+        if current_tx in self._tx_items:
+            self.setCurrentItem(self._tx_items[current_tx])
 
     def on_doubleclick(self, item, column):
         if self.permit_edit(item, column):
@@ -153,20 +177,17 @@ class HistoryList(MyTreeWidget):
                     " Please try again when it has been obtained from the network."))
 
     def update_labels(self):
-        root = self.invisibleRootItem()
-        child_count = root.childCount()
-        for i in range(child_count):
-            item = root.child(i)
-            txid = item.data(0, Qt.UserRole)
-            label = self.wallet.get_label(txid)
-            item.setText(3, label)
+        get_label = self.wallet.get_label
+        for tx_hash, item in self._tx_items.items():
+            label = get_label(tx_hash)
+            if item.text(3) != label:
+                item.setText(3, label)
 
     def update_item(self, tx_hash, height, conf, timestamp):
         status = get_tx_status(self.wallet, tx_hash, height, conf, timestamp)
-        icon = get_tx_icon(status)
-        items = self.findItems(tx_hash, Qt.UserRole|Qt.MatchContains|Qt.MatchRecursive, column=1)
-        if items:
-            item = items[0]
+        icon = self.txIcons[status]
+        item = self._tx_items.get(tx_hash)
+        if item is not None:
             item.setIcon(0, icon)
             item.setData(0, SortableTreeWidgetItem.DataRole, (status, conf))
             item.setText(2, get_tx_desc(status, timestamp))
@@ -240,6 +261,7 @@ def get_tx_desc(status: TxStatus, timestamp: Union[bool, int]) -> str:
         return TX_STATUS[status]
     return format_time(timestamp, _("unknown")) if timestamp else _("unknown")
 
+@lru_cache(maxsize=1024)
 def get_tx_tooltip(status: TxStatus, conf: int) -> str:
     text = str(conf) + " confirmation" + ("s" if conf != 1 else "")
     if status == TxStatus.UNMATURED:
@@ -248,6 +270,3 @@ def get_tx_tooltip(status: TxStatus, conf: int) -> str:
         text = text + "\n"+ TX_STATUS[status]
     return text
 
-def get_tx_icon(status: TxStatus) -> QIcon:
-    return read_QIcon(TX_ICONS[status])
-
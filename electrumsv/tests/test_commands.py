@@ -1,4 +1,3 @@
-import json
 import unittest
 from decimal import Decimal
 
@@ -10,33 +9,37 @@ privkey = PrivateKey.from_WIF('L2o1ztYYR9t7DcXGzsV2zKWJUXEmfh3C6vmKM3CCAAfeJ44Ak
 pubkey_hex = privkey.public_key.to_hex()
 
 
-class TestCommands(unittest.TestCase):
-
-    def test_setconfig_non_auth_number(self):
-        self.assertEqual(7777, Commands._setconfig_normalize_value('rpcport', "7777"))
-        self.assertEqual(7777, Commands._setconfig_normalize_value('rpcport', '7777'))
-        self.assertAlmostEqual(Decimal(2.3), Commands._setconfig_normalize_value('somekey', '2.3'))
+# (key, value, expected normalized value)
+SETCONFIG_NORMALIZE_CASES = (
+    # Non-auth numbers.
+    ('rpcport', "7777", 7777),
+    ('somekey', '2.3', Decimal('2.3')),
+    # Non-auth numbers as strings.
+    ('somekey', "'7777'", "7777"),
+    # Non-auth booleans.
+    ('show_console_tab', "true", True),
+    ('show_console_tab', "True", True),
+    # Non-auth lists.
+    ('url_rewrite', "['file:///var/www/','https://electrum.org']",
+        ['file:///var/www/', 'https://electrum.org']),
+    ('url_rewrite', '["file:///var/www/","https://electrum.org"]',
+        ['file:///var/www/', 'https://electrum.org']),
+    # Auth values are never evaluated.
+    ('rpcuser', "7777", "7777"),
+    ('rpcpassword', '7777', "7777"),
+    ('rpcpassword', '2asd', "2asd"),
+    ('rpcpassword', "['file:///var/www/','https://electrum.org']",
+        "['file:///var/www/','https://electrum.org']"),
+)
 
-    def test_setconfig_non_auth_number_as_string(self):
-        self.assertEqual("7777", Commands._setconfig_normalize_value('somekey', "'7777'"))
 
-    def test_setconfig_non_auth_boolean(self):
-        self.assertEqual(True, Commands._setconfig_normalize_value('show_console_tab', "true"))
-        self.assertEqual(True, Commands._setconfig_normalize_value('show_console_tab', "True"))
-
-    def test_setconfig_non_auth_list(self):
-        self.assertEqual(['file:///var/www/', 'https://electrum.org'],
-            Commands._setconfig_normalize_value('url_rewrite', "['file:///var/www/','https://electrum.org']"))
-        self.assertEqual(['file:///var/www/', 'https://electrum.org'],
-            Commands._setconfig_normalize_value('url_rewrite', '["file:///var/www/","https://electrum.org"]'))
+class TestCommands(unittest.TestCase):
 
-    def test_setconfig_auth(self):
-        self.assertEqual("7777", Commands._setconfig_normalize_value('rpcuser', "7777"))
-        self.assertEqual("7777", Commands._setconfig_normalize_value('rpcuser', '7777'))
-        self.assertEqual("7777", Commands._setconfig_normalize_value('rpcpassword', '7777'))
-        self.assertEqual("2asd", Commands._setconfig_normalize_value('rpcpassword', '2asd'))
-        self.assertEqual("['file:///var/www/','https://electrum.org']",
-            Commands._setconfig_normalize_value('rpcpassword', "['file:///var/www/','https://electrum.org']"))
+    def test_setconfig_normalize_value(self):
+        normalize_value = Commands._setconfig_normalize_value
+        for key, value, expected in SETCONFIG_NORMALIZE_CASES:
+            with self.subTest(key=key, value=value):
+                self.assertEqual(expected, normalize_value(key, value))
 
     def test_encrypt(self):
         c = Commands(None, None, None)